@@ -4,66 +4,52 @@ Test Files Creator - Creates sample files for testing File Organizer
 Author: Darius04-ux
 """
 
+import functools
+import importlib.metadata
+import io
 import json
+import os
+import stat
+import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Handle optional dependency: Pillow
 try:
     from PIL import Image, ImageDraw, ImageFont
+    from PIL import __version__ as PILLOW_VERSION
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
 
+# Handle optional dependency: orjson (faster JSON encoder, returns bytes)
+try:
+    import orjson
 
-def create_test_files():
-    """Create various test files for File Organizer testing"""
-    # Obsługa polskiego i angielskiego pulpitu
-    home = Path.home()
-    if (home / "Desktop").exists():
-        desktop = home / "Desktop"
-    elif (home / "Pulpit").exists():
-        desktop = home / "Pulpit"
-    else:
-        raise FileNotFoundError("Nie znaleziono folderu Desktop ani Pulpit w katalogu domowym użytkownika.")
-    test_folder = desktop / "test_files"
-    test_folder.mkdir(exist_ok=True)
-    
-    print(f"📁 Creating test files in: {test_folder}")
-    
-    # 1. Create text files
-    create_text_files(test_folder)
-    
-    # 2. Create image files
-    create_image_files(test_folder)
-    
-    # 3. Create document files
-    create_document_files(test_folder)
-    
-    # 4. Create archive files
-    create_archive_files(test_folder)
-    
-    # 5. Create code files
-    create_code_files(test_folder)
-    
-    # 6. Create other files
-    create_other_files(test_folder)
-    
-    print(f"✅ Test files created successfully!")
-    print(f"📂 Location: {test_folder}")
-    
-    # List created files
-    files = list(test_folder.glob("*"))
-    print(f"\n📋 Created {len(files)} files:")
-    for file in sorted(files):
-        if file.is_file():
-            print(f"   • {file.name}")
-
-def create_text_files(folder: Path):
-    """Create text document files"""
-    
-    # Simple text file
-    (folder / "readme.txt").write_text("""
+    def _json_encode(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_encode(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Handle optional dependency: zlib-ng (SIMD CRC32 for ZIP members)
+try:
+    from zlib_ng import zlib_ng
+    zipfile.crc32 = zlib_ng.crc32
+except ImportError:
+    pass
+
+# Pillow default font, loaded lazily by _font()
+_DEFAULT_FONT = None
+
+# O_BINARY keeps Windows from translating newlines on raw file descriptors
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+
+
+# Simple text file
+_README_TXT = b"""
 File Organizer Test Document
 ===========================
 
@@ -76,10 +62,10 @@ Features tested:
 - File moving operations
 
 Author: Darius04-ux
-""")
-    
-    # Another text file
-    (folder / "notes.txt").write_text("""
+"""
+
+# Another text file
+_NOTES_TXT = b"""
 Project Notes
 =============
 
@@ -92,103 +78,49 @@ Next steps:
 - Add more file types
 - Improve UI design
 - Add batch processing
-""")
-    
-    print("📝 Created text files")
-
-def create_image_files(folder: Path):
-    """Create sample image files."""
-    if not PILLOW_AVAILABLE:
-        print("⚠️  Pillow (PIL) not available, creating placeholder image files.")
-        (folder / "sample_image.png").write_bytes(b"PNG placeholder")
-        (folder / "test_photo.jpg").write_bytes(b"JPEG placeholder")
-        return
-
-    # Create a simple PNG image
-    img = Image.new('RGB', (400, 300), color='lightblue')
-    draw = ImageDraw.Draw(img)
-
-    # Add some text
-    try:
-        font = ImageFont.load_default()
-    except IOError:
-        # If default font is not available, proceed without it
-        font = None
-
-    draw.text((50, 100), "Test Image", fill='darkblue', font=font)
-    draw.text((50, 130), "File Organizer Pro", fill='darkblue', font=font)
-    draw.text((50, 160), "Sample PNG File", fill='darkblue', font=font)
-
-    # Draw some shapes
-    draw.rectangle([50, 200, 150, 250], outline='red', width=3)
-    draw.ellipse([200, 200, 300, 250], outline='green', width=3)
-
-    img.save(folder / "sample_image.png")
-
-    # Create another image (JPG)
-    img2 = Image.new('RGB', (300, 200), color='lightgreen')
-    draw2 = ImageDraw.Draw(img2)
-    draw2.text((50, 80), "JPEG Test File", fill='darkgreen', font=font)
-    draw2.text((50, 110), "For File Organizer", fill='darkgreen', font=font)
-    img2.save(folder / "test_photo.jpg", "JPEG")
-    print("🖼️  Created image files")
+"""
 
-def create_document_files(folder: Path):
-    """Create document-like files"""
-    
-    # Create a fake PDF (just text with .pdf extension)
-    pdf_content = """
-%PDF-1.4 (This is a fake PDF for testing)
-File Organizer Pro - Test Document
-==================================
+# Fake PDF (just text with .pdf extension)
+_PDF_CONTENT = b"\n".join([
+    b"",
+    b"%PDF-1.4 (This is a fake PDF for testing)",
+    b"File Organizer Pro - Test Document",
+    b"==================================",
+    b"",
+    b"This file simulates a PDF document.",
+    b"In real usage, this would be a proper PDF file.",
+    b"",
+    b"The File Organizer should move this to Documents folder.",
+    b"",
+    b"Test completed successfully!",
+    b"",
+])
 
-This file simulates a PDF document.
-In real usage, this would be a proper PDF file.
+# RTF file
+_RTF_CONTENT = b"\n".join([
+    rb"{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}}",
+    rb"\f0\fs24 File Organizer Test RTF Document\par",
+    rb"\par",
+    rb"This is a Rich Text Format document for testing.\par",
+    rb"\par",
+    rb"Features:\par",
+    rb"- RTF formatting\par",
+    rb"- Document organization\par",
+    rb"- File type detection\par",
+    rb"\par",
+    rb"Author: Darius04-ux\par",
+    b"}",
+])
 
-The File Organizer should move this to Documents folder.
+# Members of the test ZIP archive
+_ZIP_README_TXT = b"This is content inside the ZIP file"
+_ZIP_DATA_JSON = b'{"test": "data", "file": "organizer"}'
+_ZIP_NESTED_TXT = b"Nested file content"
+# Fixed member timestamp keeps the archive byte-identical between runs
+_ZIP_DATE_TIME = (2025, 1, 1, 10, 0, 0)
 
-Test completed successfully!
-"""
-    (folder / "test_document.pdf").write_text(pdf_content)
-    
-    # Create RTF file
-    rtf_content = r"""{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}}
-\f0\fs24 File Organizer Test RTF Document\par
-\par
-This is a Rich Text Format document for testing.\par
-\par
-Features:\par
-- RTF formatting\par
-- Document organization\par
-- File type detection\par
-\par
-Author: Darius04-ux\par
-}"""
-    (folder / "report.rtf").write_text(rtf_content)
-    
-    print("📄 Created document files")
-
-def create_archive_files(folder: Path):
-    """Create archive files"""
-    
-    # Create a ZIP file
-    zip_path = folder / "test_archive.zip"
-    with zipfile.ZipFile(zip_path, 'w') as zipf:
-        # Add some content to the zip
-        zipf.writestr("readme.txt", "This is content inside the ZIP file")
-        zipf.writestr("data.json", '{"test": "data", "file": "organizer"}')
-        zipf.writestr("folder/nested_file.txt", "Nested file content")
-    
-    # Create another archive (fake RAR)
-    (folder / "backup.rar").write_bytes(b"RAR archive placeholder for testing")
-    
-    print("📦 Created archive files")
-
-def create_code_files(folder: Path):
-    """Create code files"""
-    
-    # Python file
-    python_code = '''#!/usr/bin/env python3
+# Python file
+_PYTHON_CODE = b'''#!/usr/bin/env python3
 """
 Sample Python script for File Organizer testing
 """
@@ -200,10 +132,9 @@ def hello_world():
 if __name__ == "__main__":
     hello_world()
 '''
-    (folder / "sample_script.py").write_text(python_code)
-    
-    # JavaScript file
-    js_code = '''// Sample JavaScript file for testing
+
+# JavaScript file
+_JS_CODE = b'''// Sample JavaScript file for testing
 console.log("File Organizer Pro - JavaScript Test");
 
 function organizeFiles() {
@@ -213,10 +144,9 @@ function organizeFiles() {
 
 organizeFiles();
 '''
-    (folder / "app.js").write_text(js_code)
-    
-    # HTML file
-    html_code = '''<!DOCTYPE html>
+
+# HTML file
+_HTML_CODE = b'''<!DOCTYPE html>
 <html>
 <head>
     <title>File Organizer Test</title>
@@ -228,34 +158,28 @@ organizeFiles();
 </body>
 </html>
 '''
-    (folder / "index.html").write_text(html_code)
-    
-    print("💻 Created code files")
-
-def create_other_files(folder: Path):
-    """Create other miscellaneous files"""
-    
-    # JSON data file
-    json_data = {
-        "app_name": "File Organizer Pro",
-        "version": "1.0",
-        "author": "Darius04-ux",
-        "test_files": [
-            "readme.txt",
-            "sample_image.png",
-            "test_document.pdf"
-        ],
-        "features": [
-            "File organization",
-            "GUI interface",
-            "Undo functionality",
-            "Logging system"
-        ]
-    }
-    (folder / "config.json").write_text(json.dumps(json_data, indent=2))
-    
-    # XML file
-    xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
+
+# JSON data file
+_CONFIG = {
+    "app_name": "File Organizer Pro",
+    "version": "1.0",
+    "author": "Darius04-ux",
+    "test_files": [
+        "readme.txt",
+        "sample_image.png",
+        "test_document.pdf"
+    ],
+    "features": [
+        "File organization",
+        "GUI interface",
+        "Undo functionality",
+        "Logging system"
+    ]
+}
+_CONFIG_JSON = _json_encode(_CONFIG)
+
+# XML file
+_XML_CONTENT = b'''<?xml version="1.0" encoding="UTF-8"?>
 <fileorganizer>
     <name>File Organizer Pro</name>
     <author>Darius04-ux</author>
@@ -267,31 +191,231 @@ def create_other_files(folder: Path):
     </files>
 </fileorganizer>
 '''
-    (folder / "data.xml").write_text(xml_content)
-    
-    # Log file
-    log_content = '''2025-01-01 10:00:00 - INFO - File Organizer started
-2025-01-01 10:00:01 - INFO - Scanning folder for files
-2025-01-01 10:00:02 - INFO - Found 15 files to organize
-2025-01-01 10:00:03 - INFO - Created Images folder
-2025-01-01 10:00:04 - INFO - Moved sample_image.png to Images/
-2025-01-01 10:00:05 - INFO - Created Documents folder
-2025-01-01 10:00:06 - INFO - Moved test_document.pdf to Documents/
-2025-01-01 10:00:07 - INFO - Organization completed successfully
-'''
-    (folder / "organizer.log").write_text(log_content)
-    
-    print("📋 Created other files")
+
+# Log file: one "<timestamp> - INFO - <message>" line per entry
+_LOG_ENTRIES = (
+    ("2025-01-01 10:00:00", "File Organizer started"),
+    ("2025-01-01 10:00:01", "Scanning folder for files"),
+    ("2025-01-01 10:00:02", "Found 15 files to organize"),
+    ("2025-01-01 10:00:03", "Created Images folder"),
+    ("2025-01-01 10:00:04", "Moved sample_image.png to Images/"),
+    ("2025-01-01 10:00:05", "Created Documents folder"),
+    ("2025-01-01 10:00:06", "Moved test_document.pdf to Documents/"),
+    ("2025-01-01 10:00:07", "Organization completed successfully"),
+)
+_LOG_CONTENT = "".join(
+    f"{timestamp} - INFO - {message}\n" for timestamp, message in _LOG_ENTRIES
+).encode()
+
+# (file name, payload) pairs written verbatim on every run
+_STATIC_FILES: tuple[tuple[str, bytes], ...] = (
+    ("readme.txt", _README_TXT),
+    ("notes.txt", _NOTES_TXT),
+    ("test_document.pdf", _PDF_CONTENT),
+    ("report.rtf", _RTF_CONTENT),
+    ("sample_script.py", _PYTHON_CODE),
+    ("app.js", _JS_CODE),
+    ("index.html", _HTML_CODE),
+    ("config.json", _CONFIG_JSON),
+    ("data.xml", _XML_CONTENT),
+    ("organizer.log", _LOG_CONTENT),
+)
+
+
+def _write(path: str, data: bytes):
+    """Write bytes with os.write, bypassing Python's buffered I/O"""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        # os.write may accept only part of a large buffer
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _read(path: str) -> bytes:
+    """Read a whole file without going through pathlib"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _write_if_changed(path: str, data: bytes) -> bool:
+    """Write data unless path already holds exactly these bytes"""
+    try:
+        st = os.stat(path, follow_symlinks=False)
+    except FileNotFoundError:
+        st = None
+    # Size check first, so only same-sized files are read back
+    if (st is not None and stat.S_ISREG(st.st_mode)
+            and st.st_size == len(data) and _read(path) == data):
+        return False
+    _write(path, data)
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _desktop() -> Path:
+    """Locate the user's desktop folder (resolved once per process)"""
+    # Obsługa polskiego i angielskiego pulpitu
+    home = Path.home()
+    if (home / "Desktop").exists():
+        return home / "Desktop"
+    if (home / "Pulpit").exists():
+        return home / "Pulpit"
+    raise FileNotFoundError("Nie znaleziono folderu Desktop ani Pulpit w katalogu domowym użytkownika.")
+
+def create_test_files():
+    """Create various test files for File Organizer testing"""
+    test_folder = _desktop() / "test_files"
+    os.makedirs(test_folder, exist_ok=True)
+
+    # Status lines are collected and written to stdout in one go
+    messages = [f"📁 Creating test files in: {test_folder}\n"]
+    try:
+        # Static payloads plus whatever the generators render
+        tasks = list(_STATIC_FILES)
+        messages.append(f"📝 Prepared {len(tasks)} text, document, code and other files\n")
+        for generate in _DYNAMIC_FILES:
+            tasks.extend(generate(messages))
+
+        # Plain str paths skip building a Path object per file
+        folder_str = os.fspath(test_folder)
+        paths = [os.path.join(folder_str, name) for name, _ in tasks]
+
+        # Small-file writes are I/O bound, so let the OS overlap them
+        with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as executor:
+            futures = [executor.submit(_write_if_changed, path, data)
+                       for path, (_, data) in zip(paths, tasks)]
+            unchanged = sum(not future.result() for future in futures)
+
+        if unchanged:
+            messages.append(f"⏭️  Skipped {unchanged} files that were already up to date\n")
+        messages.append("✅ Test files created successfully!\n")
+        messages.append(f"📂 Location: {test_folder}\n")
+
+        # List created files (DirEntry.is_file() needs no extra stat call)
+        with os.scandir(test_folder) as it:
+            entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+        messages.append(f"\n📋 {len(entries)} files in folder:\n")
+        messages.extend(f"   • {entry.name}\n" for entry in entries)
+    finally:
+        sys.stdout.write("".join(messages))
+
+def _pillow_is_simd() -> bool:
+    """Tell whether the installed Pillow is the Pillow-SIMD build"""
+    # Pillow-SIMD reports a plain version string, so ask the package metadata
+    try:
+        importlib.metadata.version("pillow-simd")
+        return True
+    except importlib.metadata.PackageNotFoundError:
+        # No metadata for it: Pillow-SIMD releases carry a .postN suffix
+        return ".post" in PILLOW_VERSION
+
+def suggest_pillow_simd():
+    """Suggest Pillow-SIMD when the CPU supports its AVX2 kernels"""
+    if not PILLOW_AVAILABLE or _pillow_is_simd():
+        return
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        # Not Linux (or no procfs) - nothing to detect
+        return
+    if " avx2" in cpuinfo:
+        print(f"💡 Pillow {PILLOW_VERSION} is not the SIMD build; AVX2 detected, "
+              "'pip install pillow-simd' speeds up image encoding")
+
+def _font():
+    """Return Pillow's default font, loading it only once"""
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        try:
+            _DEFAULT_FONT = ImageFont.load_default()
+        except IOError:
+            # If default font is not available, proceed without it
+            return None
+    return _DEFAULT_FONT
+
+def create_image_files(messages: list[str]) -> list[tuple[str, bytes]]:
+    """Create sample image files."""
+    if not PILLOW_AVAILABLE:
+        messages.append("⚠️  Pillow (PIL) not available, creating placeholder image files.\n")
+        return [
+            ("sample_image.png", b"PNG placeholder"),
+            ("test_photo.jpg", b"JPEG placeholder"),
+        ]
+
+    # Create a simple PNG image
+    img = Image.new('RGB', (400, 300), color='lightblue')
+    draw = ImageDraw.Draw(img)
+
+    # Add some text
+    font = _font()
+
+    draw.text((50, 100), "Test Image", fill='darkblue', font=font)
+    draw.text((50, 130), "File Organizer Pro", fill='darkblue', font=font)
+    draw.text((50, 160), "Sample PNG File", fill='darkblue', font=font)
+
+    # Draw some shapes
+    draw.rectangle([50, 200, 150, 250], outline='red', width=3)
+    draw.ellipse([200, 200, 300, 250], outline='green', width=3)
+
+    # A handful of flat colors fits an 8-bit palette, which leaves libpng
+    # a third of the bytes to filter and compress at the fastest zlib level
+    img = img.convert('P', palette=Image.ADAPTIVE, colors=8)
+    png = io.BytesIO()
+    img.save(png, "PNG", optimize=False, compress_level=1)
+
+    # Create another image (JPG)
+    img2 = Image.new('RGB', (300, 200), color='lightgreen')
+    draw2 = ImageDraw.Draw(img2)
+    draw2.text((50, 80), "JPEG Test File", fill='darkgreen', font=font)
+    draw2.text((50, 110), "For File Organizer", fill='darkgreen', font=font)
+    # Skip the extra Huffman optimization pass of libjpeg(-turbo); RGB input
+    # with 4:2:0 subsampling goes straight to its SIMD YCbCr conversion
+    jpg = io.BytesIO()
+    img2.save(jpg, "JPEG", quality=75, optimize=False, progressive=False,
+              subsampling=2)
+    messages.append("🖼️  Created image files\n")
+    return [
+        ("sample_image.png", png.getvalue()),
+        ("test_photo.jpg", jpg.getvalue()),
+    ]
+
+def create_archive_files(messages: list[str]) -> list[tuple[str, bytes]]:
+    """Create archive files"""
+
+    # Create a ZIP file in memory
+    zip_buffer = io.BytesIO()
+    # Store only: the archive is tiny and DEFLATE would just burn CPU
+    with zipfile.ZipFile(zip_buffer, 'w', compression=zipfile.ZIP_STORED,
+                         allowZip64=False) as zipf:
+        # Add some content to the zip
+        zipf.writestr(zipfile.ZipInfo("readme.txt", _ZIP_DATE_TIME), _ZIP_README_TXT)
+        zipf.writestr(zipfile.ZipInfo("data.json", _ZIP_DATE_TIME), _ZIP_DATA_JSON)
+        zipf.writestr(zipfile.ZipInfo("folder/nested_file.txt", _ZIP_DATE_TIME),
+                      _ZIP_NESTED_TXT)
+
+    messages.append("📦 Created archive files\n")
+    return [
+        ("test_archive.zip", zip_buffer.getvalue()),
+        # Create another archive (fake RAR)
+        ("backup.rar", b"RAR archive placeholder for testing"),
+    ]
+
+# Generators for files whose content is rendered at run time
+_DYNAMIC_FILES = (
+    create_image_files,
+    create_archive_files,
+)
 
 if __name__ == "__main__":
     print("🚀 File Organizer Pro - Test Files Creator")
     print("=" * 50)
-    
+    suggest_pillow_simd()
+
     try:
         create_test_files()
         print("\n✅ All test files created successfully!")
         print("🎯 Now you can test the File Organizer with these files!")
-        
+
     except Exception as e:
         print(f"❌ Error creating test files: {e}")
         print("💡 Try running as administrator if you get permission errors")